@@ -1,7 +1,14 @@
 """Custom Logger for the application"""
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import sys
+import threading
+from datetime import datetime
 from functools import lru_cache
+import orjson
 from rich.logging import RichHandler
 from rich.traceback import install
 from rich.console import Console
@@ -9,6 +16,78 @@ from pathlib import Path
 from backend.core.path_config import LOGPATH
 from backend.core.config import settings
 
+LOGGER_NAME = "betr"
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that buffers writes and flushes them on a fixed interval.
+
+    Attributes:
+        buffer_size (int): The size in bytes of the underlying write buffer.
+        flush_interval (float): The number of seconds between buffer flushes.
+    """
+
+    def __init__(self, filename, mode='a', encoding=None, delay=False, errors=None,
+                 buffer_size: int = 65536, flush_interval: float = 0.2):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._closing = threading.Event()
+        super().__init__(filename, mode, encoding, delay, errors)
+        self._flusher = threading.Thread(target=self._flush_loop, name=f"log-flush-{self.baseFilename}", daemon=True)
+        self._flusher.start()
+
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def _flush_loop(self):
+        """Flush the write buffer every flush_interval seconds until the handler is closed."""
+        while not self._closing.wait(self.flush_interval):
+            self.flush()
+
+    def emit(self, record):
+        """Write a record to the buffer without flushing it to disk."""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        """Stop the flusher thread and close the log file."""
+        self._closing.set()
+        super().close()
+
+
+class JsonLinesHandler(BufferedFileHandler):
+    """Buffered handler that writes each record's fields as one raw orjson line.
+
+    Records are expected to carry their fields in a ``fields`` attribute, as set by
+    ``BetrLogger.log_json``. The timestamp, level and logger name are added to them.
+    """
+
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, mode='ab', **kwargs)
+
+    def emit(self, record):
+        """Write the record's fields to the buffer as a JSON line."""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(orjson.dumps({
+                "time": datetime.fromtimestamp(record.created).astimezone(),
+                "level": record.levelname,
+                "logger": record.name,
+                **getattr(record, "fields", {}),
+            }, default=str, option=orjson.OPT_APPEND_NEWLINE))
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 class BetrLogger:
@@ -21,178 +100,189 @@ class BetrLogger:
 
     Methods:
         setup_logger(): Set up the logger for the application.
+
+    Records are pushed onto a queue by a ``QueueHandler`` and written out by a
+    single ``QueueListener`` thread, so callers never block on file or console I/O.
+
+    The class is a singleton and ``setup_logger`` only attaches handlers once, so
+    modules can call ``BetrLogger().setup_logger()`` without duplicating output.
     """
-    
+
+    listener: logging.handlers.QueueListener | None = None
+    events_listener: logging.handlers.QueueListener | None = None
+    _instance: "BetrLogger | None" = None
+    _setup_done: bool = False
+    _setup_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
+        self.logger = logging.getLogger(LOGGER_NAME)
         self.log_err_file = settings.LOG_STDERR_FILENAME
         self.log_std_out_file = settings.LOG_STDOUT_FILENAME
+        self.log_events_file = settings.LOG_EVENTS_FILENAME
+        self.events_logger = logging.getLogger(f"{LOGGER_NAME}.events")
+        self._levels = {
+            "info": self.logger.info,
+            "warning": self.logger.warning,
+            "error": self.logger.error,
+            "critical": self.logger.critical,
+            "debug": self.logger.debug,
+        }
 
     def setup_logger(self):
         """Set up the logger for the application."""
+        with self._setup_lock:
+            if self._setup_done:
+                return self.logger
+            self._configure()
+            BetrLogger._setup_done = True
+        return self.logger
+
+    def _configure(self):
+        """Attach the queue handler and start the listener that owns the output handlers."""
         self.logger.setLevel(logging.DEBUG)
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
-        file_handler = logging.FileHandler(self.log_std_out_file)
+        file_handler = BufferedFileHandler(self.log_std_out_file)
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        error_file_handler = logging.FileHandler(self.log_err_file)
+        error_file_handler = BufferedFileHandler(self.log_err_file)
         error_file_handler.setLevel(logging.ERROR)
         error_file_handler.setFormatter(formatter)
-        console_handler = RichHandler(show_path=False)
+        if settings.ENVIRONMENT == "development":
+            console_handler = RichHandler(show_path=False, show_time=False, markup=False, rich_tracebacks=False)
+        else:
+            console_handler = logging.StreamHandler(sys.stderr)
         console_handler.setLevel(logging.DEBUG)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(error_file_handler)
-        self.logger.addHandler(console_handler)
-        return self.logger
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, error_file_handler, console_handler,
+            respect_handler_level=True)
+        listener.start()
+        BetrLogger.listener = listener
+        atexit.register(listener.stop)
+        self._configure_events()
+
+    def _configure_events(self):
+        """Route structured records from log_json to their own JSON lines file."""
+        self.events_logger.setLevel(logging.DEBUG)
+        self.events_logger.propagate = False
+        events_queue = queue.SimpleQueue()
+        self.events_logger.addHandler(logging.handlers.QueueHandler(events_queue))
+        listener = logging.handlers.QueueListener(events_queue, JsonLinesHandler(self.log_events_file))
+        listener.start()
+        BetrLogger.events_listener = listener
+        atexit.register(listener.stop)
     
-    def log(self, message: str, level: str = "info"):
+    def log(self, message: str, level: str = "info", *args):
         """Log a message to the application log file.
 
         Args:
             message (str): The message to log.
             level (str): The level at which to log the message.
+            *args: Arguments merged into the message by the logger when the record is emitted.
         """
-        if level == "info":
-            self.logger.info(message)
-        elif level == "warning":
-            self.logger.warning(message)
-        elif level == "error":
-            self.logger.error(message)
-        elif level == "critical":
-            self.logger.critical(message)
-        else:
-            self.logger.debug(message)
+        self._levels.get(level, self.logger.debug)(message, *args)
         return self.logger
-    
-    
-    def log_traceback(self, message: str, level: str = "error"):
+
+    def log_traceback(self, message: str, level: str = "error", *args):
         """Log a traceback to the application log file.
 
         Args:
             message (str): The message to log.
             level (str): The level at which to log the message.
+            *args: Arguments merged into the message by the logger when the record is emitted.
         """
-        if level == "info":
-            self.logger.info(message, exc_info=True)
-        elif level == "warning":
-            self.logger.warning(message, exc_info=True)
-        elif level == "error":
-            self.logger.error(message, exc_info=True)
-        elif level == "critical":
-            self.logger.critical(message, exc_info=True)
-        else:
-            self.logger.debug(message, exc_info=True)
+        self._levels.get(level, self.logger.debug)(message, *args, exc_info=True)
         return self.logger
-    
-    def log_critical(self, message: str, level: str = "critical"):
+
+    def log_json(self, level: str = "info", **fields):
+        """Log a structured record to the events log file as one JSON line.
+
+        The record bypasses the text formatter, so every line of the events file is a
+        JSON object holding the fields plus the time, level and logger name.
+
+        Args:
+            level (str): The level at which to log the record.
+            **fields: The fields of the record.
+        """
+        levelno = logging.getLevelNamesMapping().get(level.upper(), logging.DEBUG)
+        self.events_logger.log(levelno, "", extra={"fields": fields})
+        return self.logger
+
+    def log_critical(self, message: str):
         """Log a critical message to the application log file.
 
         Args:
             message (str): The message to log.
-            level (str): The level at which to log the message.
         """
-        if level == "info":
-            self.logger.info(message)
-        elif level == "warning":
-            self.logger.warning(message)
-        elif level == "error":
-            self.logger.error(message)
-        elif level == "critical":
-            self.logger.critical(message)
-        else:
-            self.logger.debug(message)
+        self.logger.critical(message)
         return self.logger
-    
-    def log_debug(self, message: str, level: str = "debug"):
+
+    def log_debug(self, message: str):
         """Log a debug message to the application log file.
 
         Args:
             message (str): The message to log.
-            level (str): The level at which to log the message.
         """
-        if level == "info":
-            self.logger.info(message)
-        elif level == "warning":
-            self.logger.warning(message)
-        elif level == "error":
-            self.logger.error(message)
-        elif level == "critical":
-            self.logger.critical(message)
-        else:
-            self.logger.debug(message)
+        self.logger.debug(message)
         return self.logger
-    
-    def log_info(self, message: str, level: str = "info"):
+
+    def log_info(self, message: str):
         """Log an info message to the application log file.
 
         Args:
             message (str): The message to log.
-            level (str): The level at which to log the message.
         """
-        if level == "info":
-            self.logger.info(message)
-        elif level == "warning":
-            self.logger.warning(message)
-        elif level == "error":
-            self.logger.error(message)
-        elif level == "critical":
-            self.logger.critical(message)
-        else:
-            self.logger.debug(message)
+        self.logger.info(message)
         return self.logger
-    
-    def log_warning(self, message: str, level: str = "warning"):
+
+    def log_warning(self, message: str):
         """Log a warning message to the application log file.
 
         Args:
             message (str): The message to log.
-            level (str): The level at which to log the message.
         """
-        if level == "info":
-            self.logger.info(message)
-        elif level == "warning":
-            self.logger.warning(message)
-        elif level == "error":
-            self.logger.error(message)
-        elif level == "critical":
-            self.logger.critical(message)
-        else:
-            self.logger.debug(message)
+        self.logger.warning(message)
         return self.logger
-    
-    def log_error(self, message: str, level: str = "error"):
+
+    def log_error(self, message: str):
         """Log an error message to the application log file.
 
         Args:
             message (str): The message to log.
-            level (str): The level at which to log the message.
         """
-        if level == "info":
-            self.logger.info(message)
-        elif level == "warning":
-            self.logger.warning(message)
-        elif level == "error":
-            self.logger.error(message)
-        elif level == "critical":
-            self.logger.critical(message)
-        else:
-            self.logger.debug(message)
+        self.logger.error(message)
         return self.logger
-    
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get a child of the application logger, setting up the application handlers on first use.
+
+    Args:
+        name (str): The name of the child logger, e.g. "db" for "betr.db".
+    """
+    BetrLogger().setup_logger()
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
 
 
 if __name__ == "__main__":
     logger = BetrLogger()
     logger.setup_logger()
-    logger.log("This is a test message", "info")
-    logger.log_critical("This is a test message", "critical")
-    logger.log_debug("This is a test message", "debug")
-    logger.log_info("This is a test message", "info")
-    logger.log_warning("This is a test message", "warning")
-    logger.log_error("This is a test message", "error")
+    logger.log("This is a %s message", "info", "test")
+    logger.log_json("info", event="test", message="This is a test message")
+    logger.log_critical("This is a test message")
+    logger.log_debug("This is a test message")
+    logger.log_info("This is a test message")
+    logger.log_warning("This is a test message")
+    logger.log_error("This is a test message")
 
 
 
@@ -26,7 +26,7 @@ class Settings(BaseSettings):
     DB_USER: str = os.getenv('DB_USER', 'postgres')
     DB_PASSWORD: str = os.getenv('DB_PASSWORD', 'postgres')
     DB_NAME: str = os.getenv('DB_NAME', 'postgres')
-    DB_ECHO: Union[str, bool] = os.getenv('DB_ECHO', False) == 'True'
+    DB_ECHO: bool = os.getenv('DB_ECHO', 'False') == 'True'
     DB_URL: str = f'postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'  # noqa
 
     # SQLALCHEMY Config
@@ -122,6 +122,7 @@ class Settings(BaseSettings):
     # Logging
     LOG_STDOUT_FILENAME: str = 'betr_access.log'
     LOG_STDERR_FILENAME: str = 'betr_err.log'
+    LOG_EVENTS_FILENAME: str = 'betr_events.jsonl'
     LOG_LEVEL: Literal['DEBUG', 'INFO',
                        'WARNING', 'ERROR', 'CRITICAL'] = 'INFO'
     LOG_FORMAT: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -8,50 +8,52 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+_HERE = Path(__file__).resolve()
+
 # Root directory path
-ROOT_DIR = Path(__file__).resolve().parents[3]
+ROOT_DIR = _HERE.parents[3]
 
 # Backend directory path
-BACKEND_DIR = Path(__file__).resolve().parents[1]
+BACKEND_DIR = _HERE.parents[1]
 
 # Versions directory path
-VERSIONS = Path(BACKEND_DIR, 'alembic', 'versions')
+VERSIONS = BACKEND_DIR / 'alembic' / 'versions'
 
 # Log directory path
-LOGPATH = Path(BACKEND_DIR, 'logs')
+LOGPATH = BACKEND_DIR / 'logs'
 
 # Data directory path
-DATA_PATH = Path(BACKEND_DIR, 'data')
+DATA_PATH = BACKEND_DIR / 'data'
 
 # NBA data directory path
-NBA_DATA_PATH = Path(BACKEND_DIR, 'data', 'nba')
+NBA_DATA_PATH = DATA_PATH / 'nba'
 
 # NHL data directory path
-NHL_DATA_PATH = Path(BACKEND_DIR, 'data', 'nhl')
+NHL_DATA_PATH = DATA_PATH / 'nhl'
 
 # MLB data directory path
-MLB_DATA_PATH = Path(BACKEND_DIR, 'data', 'mlb')
+MLB_DATA_PATH = DATA_PATH / 'mlb'
 
 # NFL data directory path
-NFL_DATA_PATH = Path(BACKEND_DIR, 'data', 'nfl')
+NFL_DATA_PATH = DATA_PATH / 'nfl'
 
 # UFC data directory path
-UFC_DATA_PATH = Path(BACKEND_DIR, 'data', 'ufc')
+UFC_DATA_PATH = DATA_PATH / 'ufc'
 
 # DB directory path
-DB_PATH = Path(BACKEND_DIR, 'database')
+DB_PATH = BACKEND_DIR / 'database'
 
 # API directory path
-API_PATH = Path(BACKEND_DIR, 'api')
+API_PATH = BACKEND_DIR / 'api'
 
 # Core directory path
-CONFIG_PATH = Path(BACKEND_DIR, 'core')
+CONFIG_PATH = BACKEND_DIR / 'core'
 
 # Models directory path
-MODELS_PATH = Path(BACKEND_DIR, 'models')
+MODELS_PATH = BACKEND_DIR / 'models'
 
 # Scripts directory path
-SCRIPTS_PATH = Path(BACKEND_DIR, 'scripts')
+SCRIPTS_PATH = BACKEND_DIR / 'scripts'
 
 # Utils directory path
-UTILS_PATH = Path(BACKEND_DIR, 'utils')
+UTILS_PATH = BACKEND_DIR / 'utils'
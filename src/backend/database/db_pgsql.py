@@ -1,68 +1,107 @@
 """Main Database Connection for Postgres Database."""
 
 # Standard Library
-from typing import Any, Dict, List, Sequence
+import warnings
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List
 from sqlmodel import create_engine, Session, Table, MetaData, Column, text
-from sqlalchemy import Table, MetaData, Column, Engine, Row
+from sqlalchemy import Table, MetaData, Column, Engine, Result, exists, literal_column, select, table
 
-from backend.common.log import BetrLogger
+from backend.common.log import get_logger
 from backend.core.config import settings
 
-log = BetrLogger().setup_logger()
+log = get_logger("db")
+
+_METADATA = MetaData()
+
+
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """Return the process-wide engine, creating it on first use."""
+    return create_engine(settings.DB_URL, echo=settings.DB_ECHO, future=True, pool_pre_ping=True, pool_size=20, max_overflow=0, pool_recycle=3600, pool_timeout=30, pool_reset_on_return='rollback')
+
+
+def get_session() -> Session:
+    """Create and return a new session bound to the shared engine."""
+    return Session(get_engine())
+
 
 def create_engine_and_session() -> tuple[Engine, Session]:
-    """Create and return a new engine and session."""
-    engine = create_engine(settings.DB_URL, echo=True, future=True, pool_pre_ping=True, pool_size=20, max_overflow=0, pool_recycle=3600, pool_timeout=30, pool_reset_on_return='rollback')
-    session = Session(engine)
-    return engine, session
+    """Return the shared engine and a new session.
+
+    Deprecated: use get_engine() and get_session() instead.
+    """
+    warnings.warn("create_engine_and_session() is deprecated, use get_engine() and get_session() instead",
+                  DeprecationWarning, stacklevel=2)
+    return get_engine(), get_session()
 
 
 def create_database(engine: Engine, database_name: str) -> None:
     """Create a new database."""
-    with engine.connect() as connection:
-        statement = f"CREATE DATABASE {database_name}"
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        statement = f"CREATE DATABASE {engine.dialect.identifier_preparer.quote(database_name)}"
         connection.execute(text(statement))
-        log.info(f"Database {database_name} created.")
-        connection.close()
-
+        log.info("Database %s created.", database_name)
 
 
 def create_table(engine: Engine, table_name: str, columns: List[Dict[str, Any]]) -> Table:
     """Create a new table in the database."""
-    metadata = MetaData()
-    table = Table(table_name, metadata)
-    for column in columns:
-        table.append_column(Column(column['name'], column['type'], primary_key=column['primary_key'], nullable=column['nullable']))
-    metadata.create_all(engine)
+    _evict_table(table_name)
+    table = Table(table_name, MetaData(),
+                  *(Column(column['name'], column['type'], primary_key=column['primary_key'], nullable=column['nullable']) for column in columns))
+    table.create(engine, checkfirst=True)
     return table
 
 
 def drop_table(engine: Engine, table_name: str) -> None:
     """Drop a table from the database."""
-    metadata = MetaData()
-    table = Table(table_name, metadata)
-    table.drop(engine)
+    _evict_table(table_name)
+    Table(table_name, MetaData()).drop(engine)
+
+
+def _evict_table(table_name: str) -> None:
+    """Remove a table from the shared metadata so it is reflected again on next use."""
+    table = _METADATA.tables.get(table_name)
+    if table is not None:
+        _METADATA.remove(table)
 
 
 def get_table(engine: Engine, table_name: str) -> Table:
-    """Get a table from the database."""
-    metadata = MetaData()
-    return Table(table_name, metadata, autoload_with=engine)
+    """Get a table from the database, reflecting it only the first time it is requested."""
+    table = _METADATA.tables.get(table_name)
+    if table is None:
+        table = Table(table_name, _METADATA, autoload_with=engine)
+    return table
+
+
+@contextmanager
+def get_table_data(engine: Engine, table_name: str, chunk_size: int = 1000) -> Iterator[Result[Any]]:
+    """Stream the rows of a table in the database, fetching chunk_size rows at a time.
 
+    The connection is held until the with block exits, so stopping iteration early
+    still returns it to the pool.
 
-def get_table_data(engine: Engine, table_name: str) -> Sequence[Row[Any]]:
-    """Get data from a table in the database."""
+    Examples:
+        with get_table_data(engine, table_name) as rows:
+            for row in rows:
+                ...
+    """
+    statement = select(literal_column("*")).select_from(table(table_name))
     with engine.connect() as connection:
-        result = connection.execute(text(f"SELECT * FROM {table_name}"))
-        return result.fetchall()    
+        result = connection.execution_options(yield_per=chunk_size).execute(statement)
+        try:
+            yield result
+        finally:
+            result.close()
 
 
 def validate_table_exists(engine: Engine, table_name: str) -> bool:
     """Validate that a table exists in the database and has data with the name of the table."""
     with engine.connect() as connection:
-        result = connection.execute(text(f"SELECT * FROM {table_name}"))
-        return bool(result.fetchall())
-    
+        if not connection.execute(text("SELECT to_regclass(:t) IS NOT NULL"), {"t": engine.dialect.identifier_preparer.quote(table_name)}).scalar():
+            return False
+        return bool(connection.execute(select(exists().select_from(table(table_name)))).scalar())
 
 
 
@@ -1,30 +1,45 @@
 """Base Model for all existing models."""
 import re
-import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional, Self
 
 import pandas as pd
+from pydantic import TypeAdapter
 from pydantic_settings import SettingsConfigDict
-from sqlalchemy import inspect
 from sqlalchemy.orm import declared_attr
-from sqlmodel import Field, SQLModel
-from backend.common.log import BetrLogger
+from sqlalchemy.sql import func
+from sqlmodel import Field, SQLModel, select
+from backend.common.log import get_logger
+
+try:
+    import connectorx as cx
+except ImportError:
+    cx = None
+
+log = get_logger("models")
+
+_CAMEL_RE = re.compile(r'([a-z\d])([A-Z])')
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type) -> TypeAdapter:
+    """Return a cached TypeAdapter validating a list of the given model."""
+    return TypeAdapter(list[model])
 
-log = BetrLogger().setup_logger()
 
 class Base(SQLModel):
     """Base Model for all existing models."""
     id: Optional[int] = Field(default=None, primary_key=True)
-    created_at: datetime = Field(default_factory=lambda: datetime.fromtimestamp(time.time()))
-    updated_at: datetime = Field(default_factory=lambda: datetime.fromtimestamp(time.time()))
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
     updated_by: Optional[str] = Field(default=None)
-    deleted_at: Optional[datetime] = Field(sa_column_kwargs={'onupdate': datetime.now()})
+    deleted_at: Optional[datetime] = Field(default=None, sa_column_kwargs={'onupdate': func.now()})
     deleted_by: Optional[str] = Field(default=None)
 
     @declared_attr.directive
     def __tablename__(cls) -> str:
-        return re.sub(r'([a-z\d])([A-Z])', r'\1_\2', cls.__name__).lower()
+        return _CAMEL_RE.sub(r'\1_\2', cls.__name__).lower()
     
 
 
@@ -40,19 +55,21 @@ class BasesqlModel(SQLModel):
 
     Class Methods:
         populate(*args, **kwargs): Raises a NotImplementedError. Must be implemented in the subclass.
-        primary_keys() -> DataFrame: Get the primary keys of the model.
+        primary_keys() -> list[str]: Get the primary keys of the model.
         get_or_create(session, **kwargs) -> tuple[Self | Any, bool]: Get or create an instance of the model.
         save(session) -> Self: Save an instance of the model to the database.
+        save_many(session, instances, bulk) -> list[Self]: Save many instances of the model in a single commit.
         get(session, **kwargs) -> Self | Any: Get an instance of the model.
         validate_table_exists(engine, table_name) -> bool: Validate that a table exists in the database and has data with the name of the table.
         get_table(engine, table_name) -> DataFrame: Get a table from the database.
-        validate_data(df) -> Any: Validate data using a DataValidationModel.
+        validate_data(df) -> Any: Validate the rows of a DataFrame against the model.
         get_table_data(engine, table_name) -> DataFrame: Get data from a table in the database.
 
     Examples:
         primary_keys = Model.primary_keys()
         instance, created = Model.get_or_create(session, **kwargs)
         instance = Model.save(session)
+        instances = Model.save_many(session, instances)
         instance = Model.get(session, **kwargs)
         table_exists = Model.validate_table_exists(engine, table_name)
         table = Model.get_table(engine, table_name)
@@ -64,15 +81,15 @@ class BasesqlModel(SQLModel):
                                       arbitrary_types_allowed=True, env_file='.env', env_file_encoding='utf-8')
 
     created_at: datetime = Field(
-        default_factory=lambda: datetime.fromtimestamp(time.time()))
+        default_factory=datetime.now)
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.fromtimestamp(time.time()))
+        default_factory=datetime.now)
     deleted_at: Optional[datetime] = Field(
-        sa_column_kwargs={'onupdate': datetime.now()})
+        default=None, sa_column_kwargs={'onupdate': func.now()})
 
     @declared_attr.directive
     def __tablename__(cls) -> str:
-        return re.sub(r'([a-z\d])([A-Z])', r'\1_\2', cls.__name__).lower()
+        return _CAMEL_RE.sub(r'\1_\2', cls.__name__).lower()
 
     @classmethod
     def populate(cls, *args, **kwargs):
@@ -80,32 +97,36 @@ class BasesqlModel(SQLModel):
             "populate method must be implemented in the subclass")
 
     @classmethod
-    @property
-    def primary_keys(cls):  # sourcery skip: inline-immediately-returned-variable
+    def primary_keys(cls) -> list[str]:
         """
         Get the primary keys of the model.
 
+        The keys are computed once per model class and cached on it.
+
         Returns:
-            DataFrame: A DataFrame containing the primary keys of the model.
+            list[str]: The column names of the model's table.
 
         Examples:
             primary_keys = Model.primary_keys()
         """
-
-        mapper = inspect(cls)
-        primary_keys = [column.name for column in mapper.primary_key]
-        primary_keys = cls.__table__.columns.keys()
+        primary_keys = cls.__dict__.get('_pk_cache')
+        if primary_keys is None:
+            primary_keys = list(cls.__table__.columns.keys())
+            cls._pk_cache = primary_keys
         return primary_keys
 
     @classmethod
     def get_or_create(cls, session, **kwargs) -> tuple[Self | Any, bool]:
-        """Get or create an instance of the model."""
-        instance = session.query(cls).filter_by(**kwargs).first()
+        """Get or create an instance of the model.
+
+        A new instance is flushed but not committed, so the caller controls the transaction.
+        """
+        instance = cls.get(session, **kwargs)
         created = False
         if instance is None:
             instance = cls(**kwargs)
             session.add(instance)
-            session.commit()
+            session.flush()
             created = True
         return instance, created
 
@@ -115,10 +136,25 @@ class BasesqlModel(SQLModel):
         session.commit()
         return self
 
+    @classmethod
+    def save_many(cls, session, instances, bulk: bool = False) -> list[Self]:
+        """Save many instances of the model to the database in a single commit.
+
+        Use save for a single instance. With bulk=True the rows are inserted with
+        bulk_insert_mappings, which skips ORM events and does not refresh the instances.
+        """
+        instances = list(instances)
+        if bulk:
+            session.bulk_insert_mappings(cls, [instance.model_dump(exclude_none=True) for instance in instances])
+        else:
+            session.add_all(instances)
+        session.commit()
+        return instances
+
     @classmethod
     def get(cls, session, **kwargs) -> Self | Any:
         """Get an instance of the model."""
-        return session.query(cls).filter_by(**kwargs).first()
+        return session.exec(select(cls).filter_by(**kwargs).limit(1)).first()
 
     @classmethod
     def validate_table_exists(cls, engine, table_name):
@@ -127,23 +163,27 @@ class BasesqlModel(SQLModel):
 
     @classmethod
     def get_table(cls, engine, table_name):
-        """Get a table from the database."""
-        return pd.read_sql_table(table_name, engine)
+        """Get a table from the database.
+
+        Uses connectorx to load the table straight into columnar buffers when it is
+        installed, falling back to pandas.read_sql_table otherwise.
+        """
+        if cx is None:
+            return pd.read_sql_table(table_name, engine)
+        conn_url = engine.url.set(drivername=engine.url.get_backend_name()).render_as_string(hide_password=False)
+        query = f"SELECT * FROM {engine.dialect.identifier_preparer.quote(table_name)}"
+        return cx.read_sql(conn_url, query, return_type="pandas")
 
     @classmethod
     def validate_data(cls, df):
-        """"""
-        class DataValidationModel(Base):
-            __root__: list[cls]
-
+        """Validate the rows of a DataFrame against the model."""
         try:
-            df_dict = df.to_dict(orient='records')
-            return DataValidationModel.model_validate(df_dict)
+            return _list_adapter(cls).validate_python(df.to_dict(orient='records'))
         except Exception as e:
-            log.error(f"Error: {e}")
+            log.error("Error: %s", e)
             return e
 
     @classmethod
     def get_table_data(cls, engine, table_name):
         """Get data from a table in the database."""
-        return pd.read_sql_table(table_name, engine)
+        return cls.get_table(engine, table_name)
@@ -0,0 +1,29 @@
+"""Shared fixtures for the backend tests."""
+import os
+import tempfile
+
+# Point the application log files at a scratch directory before backend is imported.
+_LOG_DIR = tempfile.mkdtemp(prefix="betr-logs-")
+os.environ.setdefault("LOG_STDOUT_FILENAME", os.path.join(_LOG_DIR, "betr_access.log"))
+os.environ.setdefault("LOG_STDERR_FILENAME", os.path.join(_LOG_DIR, "betr_err.log"))
+os.environ.setdefault("LOG_EVENTS_FILENAME", os.path.join(_LOG_DIR, "betr_events.jsonl"))
+
+import pytest
+from sqlalchemy import create_engine
+from sqlmodel import Session, SQLModel
+
+
+@pytest.fixture
+def engine():
+    """An in-memory sqlite engine with every registered model table created."""
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    """A session bound to the in-memory engine."""
+    with Session(engine) as session:
+        yield session
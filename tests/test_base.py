@@ -0,0 +1,79 @@
+"""Tests for backend.models.base."""
+from datetime import datetime
+from typing import Optional
+
+import pandas as pd
+from sqlmodel import Field
+
+from backend.models.base import BasesqlModel
+
+
+class Game(BasesqlModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    rating: float
+
+
+def test_validate_data_round_trip_fidelity(session):
+    created_at = datetime(2024, 1, 2, 12, 30, 1, 123456)
+    df = pd.DataFrame({
+        'id': [1],
+        'rating': [0.123456789012345],
+        'created_at': [created_at],
+        'updated_at': [created_at],
+        'deleted_at': [None],
+    })
+
+    games = Game.validate_data(df)
+
+    assert games[0].created_at == created_at
+    assert games[0].rating == 0.123456789012345
+    session.add_all(games)
+    session.commit()
+    stored = Game.get(session, id=1)
+    assert stored.created_at == created_at
+    assert stored.rating == 0.123456789012345
+
+
+def test_primary_keys_is_cached_per_model():
+    keys = Game.primary_keys()
+
+    assert keys == ['created_at', 'updated_at', 'deleted_at', 'id', 'rating']
+    assert Game.primary_keys() is keys
+    assert '_pk_cache' not in BasesqlModel.__dict__
+
+
+def test_get_or_create_flushes_without_committing(session):
+    game, created = Game.get_or_create(session, id=1, rating=1.5)
+
+    assert created
+    assert Game.get(session, id=1) is game
+    session.rollback()
+    assert Game.get(session, id=1) is None
+
+
+def test_get_or_create_returns_existing_instance(session):
+    Game(id=1, rating=1.5).save(session)
+
+    game, created = Game.get_or_create(session, id=1)
+
+    assert not created
+    assert game.rating == 1.5
+
+
+def test_save_many_commits_all_instances(session):
+    games = Game.save_many(session, (Game(id=i, rating=i / 2) for i in range(1, 4)))
+
+    session.rollback()
+    assert [game.id for game in games] == [1, 2, 3]
+    assert [Game.get(session, id=i).rating for i in range(1, 4)] == [0.5, 1.0, 1.5]
+
+
+def test_save_many_bulk_inserts_mappings(session):
+    created_at = datetime(2024, 1, 2, 12, 30, 1, 123456)
+    Game.save_many(session, [Game(id=1, rating=0.5, created_at=created_at), Game(id=2, rating=1.0)], bulk=True)
+
+    session.rollback()
+    stored = Game.get(session, id=1)
+    assert stored.rating == 0.5
+    assert stored.created_at == created_at
+    assert Game.get(session, id=2) is not None
@@ -0,0 +1,118 @@
+"""Tests for backend.database.db_pgsql."""
+import pytest
+from sqlalchemy import Integer, String, create_engine, text
+
+from backend.core.config import settings
+from backend.database import db_pgsql
+
+
+@pytest.fixture
+def shared_engine(monkeypatch, tmp_path):
+    """Point get_engine at a sqlite file and reset its cache around the test."""
+    monkeypatch.setattr(settings, "DB_URL", f"sqlite:///{tmp_path / 'betr.db'}")
+    db_pgsql.get_engine.cache_clear()
+    yield
+    db_pgsql.get_engine().dispose()
+    db_pgsql.get_engine.cache_clear()
+
+
+def test_get_engine_returns_shared_engine(shared_engine):
+    engine = db_pgsql.get_engine()
+
+    assert db_pgsql.get_engine() is engine
+    with db_pgsql.get_session() as session:
+        assert session.get_bind() is engine
+
+
+def test_create_engine_and_session_is_deprecated_and_uses_shared_engine(shared_engine):
+    with pytest.deprecated_call():
+        engine, session = db_pgsql.create_engine_and_session()
+
+    try:
+        assert engine is db_pgsql.get_engine()
+        assert session.get_bind() is engine
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def table_cache():
+    """Clear the shared reflection cache after the test."""
+    yield db_pgsql._METADATA
+    db_pgsql._METADATA.clear()
+
+
+def _create_players(engine):
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE players (id INTEGER PRIMARY KEY, name VARCHAR)"))
+
+
+def test_get_table_reuses_cached_reflection(engine, table_cache):
+    _create_players(engine)
+
+    table = db_pgsql.get_table(engine, "players")
+
+    assert db_pgsql.get_table(engine, "players") is table
+    assert table_cache.tables["players"] is table
+    assert table.columns.keys() == ["id", "name"]
+
+
+def test_drop_table_evicts_cached_table(engine, table_cache):
+    _create_players(engine)
+    db_pgsql.get_table(engine, "players")
+
+    db_pgsql.drop_table(engine, "players")
+
+    assert "players" not in table_cache.tables
+
+
+def test_failed_drop_table_leaves_no_placeholder(engine, table_cache):
+    with pytest.raises(Exception):
+        db_pgsql.drop_table(engine, "players")
+    _create_players(engine)
+
+    assert "players" not in table_cache.tables
+    assert db_pgsql.get_table(engine, "players").columns.keys() == ["id", "name"]
+
+
+def test_create_table_after_reflection_does_not_merge_columns(engine, table_cache):
+    _create_players(engine)
+    reflected = db_pgsql.get_table(engine, "players")
+
+    db_pgsql.create_table(engine, "players", [
+        {"name": "code", "type": String, "primary_key": True, "nullable": False},
+    ])
+
+    assert "players" not in table_cache.tables
+    table = db_pgsql.get_table(engine, "players")
+    assert table is not reflected
+    assert table.columns.keys() == ["id", "name"]
+
+
+def test_create_table_replaces_stale_reflection(engine, table_cache):
+    _create_players(engine)
+    db_pgsql.get_table(engine, "players")
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE players"))
+
+    db_pgsql.create_table(engine, "players", [
+        {"name": "player_id", "type": Integer, "primary_key": True, "nullable": False},
+    ])
+
+    assert db_pgsql.get_table(engine, "players").columns.keys() == ["player_id"]
+
+
+def test_get_table_data_streams_rows_and_releases_connection(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'stream.db'}")
+    _create_players(engine)
+    with engine.begin() as connection:
+        connection.execute(text("INSERT INTO players (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')"))
+
+    with db_pgsql.get_table_data(engine, "players", chunk_size=2) as rows:
+        assert next(iter(rows)) == (1, 'a')
+        assert engine.pool.checkedout() == 1
+
+    assert engine.pool.checkedout() == 0
+    with db_pgsql.get_table_data(engine, "players", chunk_size=2) as rows:
+        assert [row.id for row in rows] == [1, 2, 3]
+    engine.dispose()
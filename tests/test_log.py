@@ -0,0 +1,139 @@
+"""Tests for backend.common.log."""
+import logging
+import time
+
+import orjson
+
+from backend.common.log import LOGGER_NAME, BetrLogger, BufferedFileHandler, JsonLinesHandler, get_logger
+
+
+def test_betr_logger_is_a_singleton():
+    assert BetrLogger() is BetrLogger()
+
+
+def test_setup_logger_attaches_handlers_once():
+    logger = BetrLogger().setup_logger()
+    handlers = list(logger.handlers)
+
+    assert BetrLogger().setup_logger() is logger
+    assert logger.handlers == handlers
+    assert len(handlers) == 1
+
+
+def test_get_logger_returns_child_of_application_logger():
+    child = get_logger("tests")
+
+    assert child.name == f"{LOGGER_NAME}.tests"
+    assert child.parent is logging.getLogger(LOGGER_NAME)
+    assert child.parent.handlers
+    assert not child.handlers
+
+
+def _record(message):
+    return logging.LogRecord("test", logging.INFO, __file__, 0, message, None, None)
+
+
+def test_buffered_file_handler_buffers_records(tmp_path):
+    path = tmp_path / "buffered.log"
+    handler = BufferedFileHandler(path, flush_interval=60)
+    try:
+        handler.handle(_record("first"))
+
+        assert path.read_text() == ""
+    finally:
+        handler.close()
+
+
+def test_buffered_file_handler_flushes_on_interval(tmp_path):
+    path = tmp_path / "buffered.log"
+    handler = BufferedFileHandler(path, flush_interval=0.05)
+    try:
+        handler.handle(_record("first"))
+
+        deadline = time.monotonic() + 5
+        while path.read_text() != "first\n" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert path.read_text() == "first\n"
+    finally:
+        handler.close()
+
+
+def test_buffered_file_handler_close_flushes_and_stops_flusher(tmp_path):
+    path = tmp_path / "buffered.log"
+    handler = BufferedFileHandler(path, flush_interval=60)
+    handler.handle(_record("last"))
+
+    handler.close()
+
+    assert path.read_text() == "last\n"
+    handler._flusher.join(timeout=1)
+    assert not handler._flusher.is_alive()
+
+
+def test_log_takes_level_positionally_and_lazy_args(caplog):
+    logger = BetrLogger()
+    logger.setup_logger()
+
+    with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME):
+        logger.log("hello", "error")
+        logger.log("hello %s", "warning", "world")
+
+    assert [(r.levelno, r.getMessage()) for r in caplog.records] == [
+        (logging.ERROR, "hello"),
+        (logging.WARNING, "hello world"),
+    ]
+
+
+def test_log_traceback_accepts_lazy_args(caplog):
+    logger = BetrLogger()
+    logger.setup_logger()
+
+    with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.log_traceback("failed %s", "error", "job")
+
+    record, = caplog.records
+    assert record.levelno == logging.ERROR
+    assert record.getMessage() == "failed job"
+    assert record.exc_info[0] is ValueError
+
+
+def test_json_lines_handler_writes_one_json_object_per_record(tmp_path):
+    path = tmp_path / "events.jsonl"
+    handler = JsonLinesHandler(path)
+    first, second = _record("ignored"), _record("ignored")
+    first.fields = {"event": "bet_placed", "odds": 1.5}
+    second.fields = {"event": "bet_settled"}
+
+    handler.handle(first)
+    handler.handle(second)
+    handler.close()
+
+    lines = [orjson.loads(line) for line in path.read_bytes().splitlines()]
+    assert [line["event"] for line in lines] == ["bet_placed", "bet_settled"]
+    assert lines[0]["odds"] == 1.5
+    assert lines[0]["level"] == "INFO"
+    assert "time" in lines[0]
+
+
+def test_log_json_routes_fields_to_events_logger_only():
+    logger = BetrLogger()
+    logger.setup_logger()
+    events, text_records = [], []
+    events_capture, text_capture = logging.Handler(), logging.Handler()
+    events_capture.emit = events.append
+    text_capture.emit = text_records.append
+    logger.events_logger.addHandler(events_capture)
+    logger.logger.addHandler(text_capture)
+    try:
+        logger.log_json("warning", event="bet_placed", odds=1.5)
+    finally:
+        logger.events_logger.removeHandler(events_capture)
+        logger.logger.removeHandler(text_capture)
+
+    record, = events
+    assert record.levelno == logging.WARNING
+    assert record.fields == {"event": "bet_placed", "odds": 1.5}
+    assert not text_records